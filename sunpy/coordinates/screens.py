@@ -2,11 +2,12 @@
 Screen class definitions for making assumptions about off-disk emission
 """
 import abc
+import math
 
 import numpy as np
 
 import astropy.units as u
-from astropy.coordinates.representation import CartesianRepresentation, UnitSphericalRepresentation
+from astropy.coordinates.representation import UnitSphericalRepresentation
 
 from sunpy.coordinates import HeliographicStonyhurst, Helioprojective
 from sunpy.util.decorators import ACTIVE_CONTEXTS
@@ -14,6 +15,31 @@ from sunpy.util.decorators import ACTIVE_CONTEXTS
 __all__ = ['BaseScreen', 'SphericalScreen', 'PlanarScreen']
 
 
+def _default_radius(center):
+    # The distance from the screen center to Sun center
+    hgs_frame = HeliographicStonyhurst(obstime=center.obstime)
+    return center.transform_to(hgs_frame).radius
+
+
+def _transform_center(center, frame, cached_center):
+    # The transformed center depends only on the frame attributes and not on the frame data,
+    # so reuse the cached (frame, center) pair for repeated calls with equivalent frames
+    cached_frame, sphere_center = cached_center
+    if cached_frame is None or not frame.is_equivalent_frame(cached_frame):
+        cached_frame = frame.replicate_without_data()
+        sphere_center = center.transform_to(cached_frame).cartesian
+    return cached_frame, sphere_center
+
+
+def _scalar_line_of_sight(frame):
+    # Cartesian components of the line-of-sight unit vector for a scalar frame, computed with
+    # plain floats to avoid the array machinery for single-coordinate lookups
+    rep = frame.represent_as(UnitSphericalRepresentation)
+    lon, lat = rep.lon.to_value(u.rad), rep.lat.to_value(u.rad)
+    cos_lat = math.cos(lat)
+    return cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat)
+
+
 class BaseScreen(abc.ABC):
 
     def __init__(self, only_off_disk=False):
@@ -103,23 +129,96 @@ class SphericalScreen(BaseScreen):
     @u.quantity_input
     def __init__(self, center, *, radius: u.m=None, **kwargs):
         self._center = center
-        if radius is not None:
-            self._radius = radius
-        else:
-            hgs_frame = HeliographicStonyhurst(obstime=self._center.obstime)
-            center_hgs = self._center.transform_to(hgs_frame)
-            self._radius = center_hgs.radius
+        self._radius = radius if radius is not None else _default_radius(center)
+        self._cached_center = (None, None)
         super().__init__(**kwargs)
 
+    @classmethod
+    @u.quantity_input
+    def batched(cls, centers, *, radius: u.m=None):
+        """
+        Create a batch of spherical screens to calculate distances for many screen centers at once.
+
+        Unlike a `~sunpy.coordinates.SphericalScreen`, the returned object is not a screen and
+        cannot be used as a context manager.  Instead, its ``calculate_distance(frame)`` method returns the distances
+        for every screen at once, as an array with the shape of ``centers`` followed by the shape
+        of ``frame``.
+
+        Parameters
+        ----------
+        centers : `~astropy.coordinates.SkyCoord`
+            The centers of the spherical screens
+        radius : `~astropy.units.Quantity`, optional
+            The radii of the spherical screens, which must broadcast against ``centers``. The
+            default sets each radius to the distance from the screen center to the Sun.
+
+        Examples
+        --------
+        >>> import astropy.units as u
+        >>> from astropy.coordinates import SkyCoord
+        >>> from sunpy.coordinates import HeliographicStonyhurst, Helioprojective, SphericalScreen
+        >>> h = Helioprojective(range(7)*u.arcsec*319, [0]*7*u.arcsec,
+        ...                     observer='earth', obstime='2020-04-08')
+        >>> centers = SkyCoord([0, 30, 60]*u.deg, [0]*3*u.deg, [1]*3*u.AU,
+        ...                    frame=HeliographicStonyhurst, obstime='2020-04-08')
+        >>> SphericalScreen.batched(centers).calculate_distance(h).shape
+        (3, 7)
+        """
+        return _BatchedSphericalScreen(centers, radius=radius)
+
+    def calculate_distance(self, frame):
+        self._cached_center = _transform_center(self._center, frame, self._cached_center)
+        sphere_center = self._cached_center[1]
+        unit = sphere_center.x.unit
+        center_xyz = sphere_center.get_xyz(xyz_axis=-1).to_value(unit)
+        radius = self._radius.to_value(unit)
+        if frame.shape == () and center_xyz.ndim == 1 and np.ndim(radius) == 0:
+            cx, cy, cz = center_xyz
+            ux, uy, uz = _scalar_line_of_sight(frame)
+            am_proj = cx*ux + cy*uy + cz*uz
+            disc = radius**2 - (cx*cx + cy*cy + cz*cz) + am_proj*am_proj
+            # A line of sight that misses the sphere has no solution
+            distance = am_proj + math.sqrt(disc) if disc >= 0 else math.nan
+            return distance * unit
+        rep = frame.represent_as(UnitSphericalRepresentation).to_cartesian()
+        direction_xyz = rep.get_xyz(xyz_axis=-1).to_value(u.one)
+        # Project the screen center onto the line of sight, and then find the
+        # half-chord length from that projection to the far side of the sphere
+        am_proj = np.einsum('...i,...i->...', center_xyz, direction_xyz)
+        am_squared = np.einsum('...i,...i->...', center_xyz, center_xyz)
+        disc = radius**2 - am_squared + am_proj * am_proj
+        # Ignore sqrt of NaNs
+        with np.errstate(invalid='ignore'):
+            distance = am_proj + np.sqrt(disc)  # use the "far" solution
+        return distance * unit
+
+
+class _BatchedSphericalScreen:
+    # Returned by SphericalScreen.batched().  This is deliberately not a BaseScreen: the distances
+    # are calculated for every screen center against every line of sight, so they cannot be used
+    # to make a frame 3D.
+
+    def __init__(self, centers, radius=None):
+        self._center = centers
+        self._radius = radius if radius is not None else _default_radius(centers)
+        self._cached_center = (None, None)
+
     def calculate_distance(self, frame):
-        sphere_center = self._center.transform_to(frame).cartesian
-        c = sphere_center.norm()**2 - self._radius**2
-        rep = frame.represent_as(UnitSphericalRepresentation)
-        b = -2 * sphere_center.dot(rep)
+        self._cached_center = _transform_center(self._center, frame, self._cached_center)
+        sphere_center = self._cached_center[1]
+        unit = sphere_center.x.unit
+        center_xyz = sphere_center.get_xyz(xyz_axis=-1).to_value(unit).reshape(-1, 3)
+        radius = np.broadcast_to(self._radius.to_value(unit), sphere_center.shape).reshape(-1, 1)
+        rep = frame.represent_as(UnitSphericalRepresentation).to_cartesian()
+        direction_xyz = rep.get_xyz(xyz_axis=-1).to_value(u.one).reshape(-1, 3)
+        # (screens, points) projections of each screen center onto each line of sight
+        am_proj = center_xyz @ direction_xyz.T
+        am_squared = np.einsum('ij,ij->i', center_xyz, center_xyz)[:, np.newaxis]
+        disc = radius**2 - am_squared + am_proj * am_proj
         # Ignore sqrt of NaNs
         with np.errstate(invalid='ignore'):
-            distance = ((-1*b) + np.sqrt(b**2 - 4*c)) / 2  # use the "far" solution
-        return distance
+            distance = am_proj + np.sqrt(disc)  # use the "far" solution
+        return distance.reshape(sphere_center.shape + frame.shape) * unit
 
 
 class PlanarScreen(BaseScreen):
@@ -187,10 +286,22 @@ class PlanarScreen(BaseScreen):
         super().__init__(**kwargs)
 
     def calculate_distance(self, frame):
-        direction = self._vantage_point.transform_to(frame).cartesian
-        direction = CartesianRepresentation(1, 0, 0) * frame.observer.radius - direction
-        direction /= direction.norm()
-        d_from_plane = (frame.observer.radius - self._distance_from_center) * direction.x
-        rep = frame.represent_as(UnitSphericalRepresentation)
-        distance = d_from_plane / rep.dot(direction)
-        return distance
+        vantage_point = self._vantage_point.transform_to(frame).cartesian
+        unit = frame.observer.radius.unit
+        observer_radius = frame.observer.radius.to_value(unit)
+        # The plane normal is the unit vector from the vantage point to Sun center.  The negation
+        # must produce a new array because get_xyz() can return a view of the representation data,
+        # which the in-place operations below would otherwise modify.
+        normal_xyz = -vantage_point.get_xyz(xyz_axis=-1).to_value(unit)
+        normal_xyz[..., 0] += observer_radius
+        normal_xyz /= np.sqrt(np.einsum('...i,...i->...', normal_xyz, normal_xyz))[..., np.newaxis]
+        d_from_plane = ((observer_radius - self._distance_from_center.to_value(unit))
+                        * normal_xyz[..., 0])
+        if frame.shape == () and normal_xyz.ndim == 1 and np.ndim(d_from_plane) == 0:
+            nx, ny, nz = normal_xyz
+            ux, uy, uz = _scalar_line_of_sight(frame)
+            return d_from_plane / (nx*ux + ny*uy + nz*uz) * unit
+        rep = frame.represent_as(UnitSphericalRepresentation).to_cartesian()
+        direction_xyz = rep.get_xyz(xyz_axis=-1).to_value(u.one)
+        distance = d_from_plane / np.einsum('...i,...i->...', direction_xyz, normal_xyz)
+        return distance * unit
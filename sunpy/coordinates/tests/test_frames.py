@@ -22,6 +22,7 @@ from sunpy.coordinates.frames import (
     HeliographicStonyhurst,
     Helioprojective,
 )
+from sunpy.coordinates.screens import BaseScreen
 from sunpy.coordinates.sun import angular_radius
 from sunpy.time import parse_time
 from sunpy.util.exceptions import SunpyDeprecationWarning, SunpyUserWarning
@@ -558,3 +559,59 @@ def test_spherical_screen(off_limb_coord, only_off_disk, distance):
     with SphericalScreen(off_limb_coord.observer, only_off_disk=only_off_disk):
         olc_3d = off_limb_coord.make_3d()
     assert u.quantity.allclose(olc_3d.distance, distance)
+
+
+def test_spherical_screen_array_radius(off_limb_coord):
+    # An observer-centered screen puts every coordinate at the screen radius
+    radius = [1, 1.1, 1.2]*u.AU
+    screen = SphericalScreen(off_limb_coord.observer, radius=radius)
+    assert u.quantity.allclose(screen.calculate_distance(off_limb_coord.frame), radius)
+
+
+def test_spherical_screen_caches_center(off_limb_coord):
+    screen = SphericalScreen(off_limb_coord.observer)
+    with screen:
+        off_limb_coord.make_3d()
+        cached_center = screen._cached_center[1]
+        off_limb_coord[1:].make_3d()
+        assert screen._cached_center[1] is cached_center
+        new_coord = SkyCoord(off_limb_coord.frame.replicate(obstime='2020-01-02'))
+        new_coord.make_3d()
+        assert screen._cached_center[1] is not cached_center
+
+
+@pytest.mark.parametrize(('screen_class', 'kwargs'), [
+    (SphericalScreen, {}),
+    (SphericalScreen, {'radius': [1, 1.1, 1.2]*u.AU}),
+    (PlanarScreen, {}),
+])
+def test_screen_scalar_matches_array(off_limb_coord, screen_class, kwargs):
+    with screen_class(off_limb_coord.observer, **kwargs):
+        array_distance = off_limb_coord.make_3d().distance
+        scalar_distance = [off_limb_coord[i].make_3d().distance for i in range(len(off_limb_coord))]
+    assert u.quantity.allclose(u.Quantity(scalar_distance), array_distance)
+
+
+def test_spherical_screen_scalar_miss(off_limb_coord):
+    sun_center = SkyCoord(0*u.deg, 0*u.deg, 0*u.m, frame=HeliographicStonyhurst,
+                          obstime=off_limb_coord.obstime)
+    with SphericalScreen(sun_center, radius=1*u.R_sun):
+        with pytest.warns(SunpyUserWarning, match='is all NaNs'):
+            assert np.isnan(off_limb_coord[0].make_3d().distance)
+
+
+def test_spherical_screen_batched(off_limb_coord):
+    frame = off_limb_coord.frame
+    centers = SkyCoord([0, 30, 60]*u.deg, [0, 10, -10]*u.deg, [1, 0.5, 2]*u.AU,
+                       frame=HeliographicStonyhurst, obstime=frame.obstime)
+    radius = [1, 2, 3]*u.AU
+    distance = SphericalScreen.batched(centers, radius=radius).calculate_distance(frame)
+    assert distance.shape == (3, 3)
+    for i in range(len(centers)):
+        expected = SphericalScreen(centers[i], radius=radius[i]).calculate_distance(frame)
+        assert u.quantity.allclose(distance[i], expected)
+
+
+def test_spherical_screen_batched_not_a_screen(off_limb_coord):
+    batch = SphericalScreen.batched(SkyCoord([off_limb_coord.observer] * 2))
+    assert not isinstance(batch, BaseScreen)
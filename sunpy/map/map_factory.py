@@ -278,6 +278,12 @@ class MapFactory(BasicRegistrationFactory):
         -----
         Extra keyword arguments are passed through to `sunpy.io._file_tools.read_file` such as
         ``memmap`` for FITS files.
+
+        The ``max_workers`` keyword sets the number of threads used to read the files
+        of a directory, glob pattern or fsspec URI concurrently. It defaults to 1, which
+        reads the files one after another. Larger values can speed up reading from
+        remote sources, but the reader for the file type must be thread-safe. If it is
+        `None`, one thread is used per file, up to 32.
         """
         data_header_pairs = self._parse_args(*args, silence_errors=silence_errors, allow_errors=allow_errors, **kwargs)
         new_maps = list()
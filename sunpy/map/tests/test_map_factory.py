@@ -97,6 +97,10 @@ def test_patterns(eit_fits_directory):
     maps_sorted = [sunpy.map.Map(os.fspath(f)) for f in files_sorted]
     assert all(m.date == m_s.date for m, m_s in zip(maps, maps_sorted))
 
+    # Directory read with several threads keeps the sorted order
+    maps = sunpy.map.Map(eit_fits_directory, max_workers=2)
+    assert all(m.date == m_s.date for m, m_s in zip(maps, maps_sorted))
+
     # Pathlib
     path = pathlib.Path(AIA_171_IMAGE)
     aiamap = sunpy.map.Map(path)
@@ -1,13 +1,36 @@
 import os
+import re
 import glob
+import stat
 import pathlib
+import functools
+import itertools
 import collections
-import urllib.request
-import re
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 HDPair = collections.namedtuple('HDPair', ['data', 'header'])
 
-def parse_uri(obj_list, f, **kwargs):
+_URL_RE = re.compile(r'^https?://', re.IGNORECASE)
+_URI_SCHEME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+\-+.]*://")
+
+def _read_all(paths, f, max_workers, **kwargs):
+    """
+    Read each of *paths* using the function *f*, optionally overlapping the
+    reads across a pool of threads, and concatenate the returned lists in order.
+    """
+    paths = list(paths)
+    if max_workers is None:
+        max_workers = min(32, len(paths))
+    if max_workers <= 1 or len(paths) <= 1:
+        results = [f(afile, **kwargs) for afile in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(functools.partial(f, **kwargs), paths))
+    return list(itertools.chain.from_iterable(results))
+
+
+def parse_uri(obj_list, f, *, max_workers=1, **kwargs):
     """
     Read in a series of fsspec OpenFile objects using the function *f*
     
@@ -16,6 +39,11 @@ def parse_uri(obj_list, f, **kwargs):
     obj_list : list of fsspec.core.OpenFile objects
     f : callable
         Must return a list of read-in data.
+    max_workers : `int`, optional
+        The maximum number of threads used to read files concurrently.
+        Defaults to 1, which reads the files one after another. Larger values
+        can help for remote sources, but require *f* to be thread-safe. If
+        `None`, one thread is used per file, up to 32.
     kwargs :
         Additional keyword arguments are handed to ``f``.
 
@@ -24,21 +52,18 @@ def parse_uri(obj_list, f, **kwargs):
     list
         List of files read in by ``f``.
     """
-    read_files = []
+    uris = []
     for obj in obj_list:
         fs = obj.fs
         path = obj.path
         if fs.isfile(path):
-            uri = fs.unstrip_protocol(path)
-            read_files += f(uri, **kwargs)
+            uris.append(fs.unstrip_protocol(path))
         elif fs.isdir(path):
-            for afile in sorted(fs.glob(path+'/*')):
-                uri = fs.unstrip_protocol(afile)
-                read_files += f(uri, **kwargs)
-    return read_files
+            uris.extend(fs.unstrip_protocol(afile) for afile in sorted(fs.glob(path+'/*')))
+    return _read_all(uris, f, max_workers, **kwargs)
 
 
-def parse_path(path, f, **kwargs):
+def parse_path(path, f, *, max_workers=1, **kwargs):
     """
     Read in a series of files at *path* using the function *f*.
 
@@ -47,6 +72,11 @@ def parse_path(path, f, **kwargs):
     path : pathlib.Path
     f : callable
         Must return a list of read-in data.
+    max_workers : `int`, optional
+        The maximum number of threads used to read files concurrently when
+        *path* is a directory or a glob pattern. Defaults to 1, which reads the
+        files one after another. Larger values require *f* to be thread-safe.
+        If `None`, one thread is used per file, up to 32.
     kwargs :
         Additional keyword arguments are handed to ``f``.
 
@@ -58,39 +88,32 @@ def parse_path(path, f, **kwargs):
     if not isinstance(path, os.PathLike):
         raise ValueError('path must be a pathlib.Path object')
     path = path.expanduser()
-    if is_file(path):
+    kind = _classify(path)
+    if kind == 'file':
         return f(path, **kwargs)
-    elif is_dir(path):
-        read_files = []
-        for afile in sorted(path.glob('*')):
-            read_files += f(afile, **kwargs)
-        return read_files
-    elif glob.glob(str(path)):
-        read_files = []
-        for afile in sorted(glob.glob(str(path))):
-            afile = pathlib.Path(afile)
-            read_files += f(afile, **kwargs)
-        return read_files
+    elif kind == 'dir':
+        return _read_all(sorted(path.iterdir()), f, max_workers, **kwargs)
+    elif (matches := sorted(glob.iglob(str(path)))):
+        return _read_all(map(pathlib.Path, matches), f, max_workers, **kwargs)
     else:
         raise ValueError(f'Did not find any files at {path}')
 
 
-# In python<3.8 paths with un-representable chars (ie. '*' on windows)
-# raise an error, so make our own version that returns False instead of
-# erroring. These can be removed when we support python >= 3.8
-# https://docs.python.org/3/library/pathlib.html#methods
-def is_file(path):
-    try:
-        return path.is_file()
-    except Exception:
-        return False
-
-
-def is_dir(path):
+def _classify(path):
+    """
+    Return ``'file'`` or ``'dir'`` for what exists at *path*, or `None` if
+    there is nothing there (or the path cannot be represented, e.g., ``'*'``
+    on Windows), using a single ``stat()`` call.
+    """
     try:
-        return path.is_dir()
-    except Exception:
-        return False
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+    if stat.S_ISREG(mode):
+        return 'file'
+    elif stat.S_ISDIR(mode):
+        return 'dir'
+    return None
 
 
 def possibly_a_path(obj):
@@ -118,12 +141,17 @@ def is_url(obj):
     -------
     bool
         True if the object is a valid URL, False otherwise.
+
+    Notes
+    -----
+    This is a purely syntactic check for an HTTP(S) URL with a network
+    location; it does not check that the URL can be reached.
     """
-    try:
-        urllib.request.urlopen(obj)
-        return True
-    except Exception:
-        return False
+    return (
+            isinstance(obj, str)
+            and bool(_URL_RE.match(obj))
+            and urllib.parse.urlparse(obj).netloc != ''
+    )
 
 def is_uri(obj):
     """
@@ -140,9 +168,8 @@ def is_uri(obj):
         True if the object is a valid URI, False otherwise.
     """
     try:
-        _RFC3896_ = re.compile(r"^[A-Za-z][A-Za-z0-9+\-+.]*://")
         return (
-                bool(_RFC3896_.match(obj))
+                bool(_URI_SCHEME_RE.match(obj))
                 and not obj.startswith(('http://', 'https://'))
         )
     except Exception:
@@ -153,4 +180,4 @@ def string_is_float(s):
         float(s)
         return True
     except ValueError:
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,81 @@
+import pathlib
+
+import fsspec
+import pytest
+
+from sunpy.util import io
+
+
+@pytest.mark.parametrize(('obj', 'expected'), [
+    ('http://data.sunpy.org/sample-data/AIA20110319_105400_0171.fits', True),
+    ('https://github.com/sunpy/data/raw/main/sunpy/v1/AIA20110607_063305_0094_lowres.fits', True),
+    ('HTTPS://sunpy.org', True),
+    ('https://', False),
+    ('s3://bucket/file.fits', False),
+    ('ftp://example.com/file.fits', False),
+    ('/home/user/file.fits', False),
+    (pathlib.Path('/home/user/file.fits'), False),
+])
+def test_is_url(obj, expected):
+    assert io.is_url(obj) is expected
+
+
+@pytest.mark.parametrize(('obj', 'expected'), [
+    ('s3://bucket/file.fits', True),
+    ('gs+ssl://bucket/file.fits', True),
+    ('ftp://example.com/file.fits', True),
+    ('http://sunpy.org', False),
+    ('https://sunpy.org', False),
+    ('/home/user/file.fits', False),
+    (pathlib.Path('/home/user/file.fits'), False),
+])
+def test_is_uri(obj, expected):
+    assert io.is_uri(obj) is expected
+
+
+def _read_name(path):
+    return [path.name]
+
+
+@pytest.mark.parametrize('max_workers', [None, 1, 4])
+def test_parse_path(tmp_path, max_workers):
+    for name in ['b.fits', 'a.fits', 'c.txt']:
+        (tmp_path / name).touch()
+    assert io.parse_path(tmp_path / 'a.fits', _read_name, max_workers=max_workers) == ['a.fits']
+    assert io.parse_path(tmp_path, _read_name,
+                         max_workers=max_workers) == ['a.fits', 'b.fits', 'c.txt']
+    assert io.parse_path(tmp_path / '*.fits', _read_name,
+                         max_workers=max_workers) == ['a.fits', 'b.fits']
+    with pytest.raises(ValueError, match='Did not find any files'):
+        io.parse_path(tmp_path / '*.cdf', _read_name)
+
+
+@pytest.mark.parametrize('max_workers', [None, 1, 4])
+def test_parse_uri(tmp_path, max_workers):
+    for name in ['b.fits', 'a.fits', 'c.txt']:
+        (tmp_path / name).touch()
+    obj_list = fsspec.open_files([f'file://{tmp_path}', f'file://{tmp_path / "a.fits"}'])
+    read_files = io.parse_uri(obj_list, lambda uri: [uri.rsplit('/', 1)[-1]],
+                              max_workers=max_workers)
+    assert read_files == ['a.fits', 'b.fits', 'c.txt', 'a.fits']
+
+
+def test_classify(tmp_path):
+    (tmp_path / 'a.fits').touch()
+    assert io._classify(tmp_path / 'a.fits') == 'file'
+    assert io._classify(tmp_path) == 'dir'
+    assert io._classify(tmp_path / '*.fits') is None
+    assert io._classify(tmp_path / 'missing.fits') is None
+
+
+@pytest.mark.parametrize('s', [
+    '1', '-1.5', '+.5', '1.', '1e10', '2.5E-3', ' 3.0 ', '1_000.5', 'inf', '-Infinity', 'NaN',
+    '', 'AIA', 'DN', '1.2.3', 'e5', '2011-06-07T06:33:02', '1e', 'information',
+])
+def test_string_is_float(s):
+    try:
+        float(s)
+        expected = True
+    except ValueError:
+        expected = False
+    assert io.string_is_float(s) is expected